@@ -4,7 +4,7 @@ from gngram_lookup.data import get_data_dir, get_hash_file, is_data_installed, i
 from gngram_lookup.find_suffixes import get_suffixes
 from gngram_lookup.find_inflections import get_inflections
 from gngram_lookup.morphology import Morphology, get_morphology
-from gngram_lookup.lookup import FrequencyData, batch_frequency, erosion_cluster, exists, frequency, prefix_cluster, word_score, wordlist
+from gngram_lookup.lookup import FrequencyData, batch_frequency, erosion_cluster, exists, frequency, prefix_cluster, preload, word_score, wordlist
 from gngram_lookup.pos import PosTag, has_pos, pos, pos_freq
 
 __all__ = [
@@ -16,6 +16,7 @@ __all__ = [
     "frequency",
     "batch_frequency",
     "FrequencyData",
+    "preload",
     "word_score",
     "wordlist",
     "prefix_cluster",
@@ -2,11 +2,21 @@
 Data path utilities for gngram-lookup.
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 
 DATA_DIR = Path.home() / ".gngram-lookup" / "data"
 POS_DATA_DIR = Path.home() / ".gngram-lookup" / "pos-data"
 
+# Positive install checks and the resolved bucket directory are cached for
+# the life of the process: lookups call is_data_installed() on every request,
+# and each uncached call walks the data directory. Negative results are not
+# cached, so data downloaded mid-process is still picked up.
+_DATA_INSTALLED = False
+_POS_DATA_INSTALLED = False
+_HASH_DIR: Path | None = None
+
 
 def get_data_dir() -> Path:
     """Return the data directory path."""
@@ -22,14 +32,18 @@ def get_hash_file(prefix: str) -> Path:
     Returns:
         Path to the parquet file (may be in subdirectory from tar extraction)
     """
-    # Handle both flat structure and nested (from tar extraction)
-    direct = DATA_DIR / f"{prefix}.parquet"
-    if direct.exists():
-        return direct
+    global _HASH_DIR
+    if _HASH_DIR is not None:
+        cached = _HASH_DIR / f"{prefix}.parquet"
+        if cached.exists():
+            return cached
 
-    nested = DATA_DIR / "parquet-hash" / f"{prefix}.parquet"
-    if nested.exists():
-        return nested
+    # Handle both flat structure and nested (from tar extraction)
+    for base in (DATA_DIR, DATA_DIR / "parquet-hash"):
+        path = base / f"{prefix}.parquet"
+        if path.exists():
+            _HASH_DIR = base
+            return path
 
     raise FileNotFoundError(
         f"Data file not found for prefix '{prefix}'. "
@@ -39,9 +53,10 @@ def get_hash_file(prefix: str) -> Path:
 
 def is_data_installed() -> bool:
     """Check if data files are installed."""
-    if not DATA_DIR.exists():
-        return False
-    return any(DATA_DIR.glob("**/*.parquet"))
+    global _DATA_INSTALLED
+    if not _DATA_INSTALLED:
+        _DATA_INSTALLED = DATA_DIR.exists() and any(DATA_DIR.glob("**/*.parquet"))
+    return _DATA_INSTALLED
 
 
 def get_wordlist_file() -> Path:
@@ -89,6 +104,7 @@ def get_pos_hash_file(prefix: str) -> Path:
 
 def is_pos_data_installed() -> bool:
     """Check if POS data files are installed."""
-    if not POS_DATA_DIR.exists():
-        return False
-    return any(POS_DATA_DIR.glob("**/*.parquet"))
+    global _POS_DATA_INSTALLED
+    if not _POS_DATA_INSTALLED:
+        _POS_DATA_INSTALLED = POS_DATA_DIR.exists() and any(POS_DATA_DIR.glob("**/*.parquet"))
+    return _POS_DATA_INSTALLED
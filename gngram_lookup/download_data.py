@@ -7,10 +7,14 @@ Usage:
 Downloads parquet hash files to ~/.gngram-lookup/data/
 """
 
+from __future__ import annotations
+
+import http.client
+import shutil
 import sys
 import tarfile
+import tempfile
 import urllib.request
-from io import BytesIO
 from pathlib import Path
 
 GITHUB_REPO = "craigtrim/gngram-lookup"
@@ -19,6 +23,28 @@ DATA_FILENAME = "parquet-hash.tar.gz"
 
 DATA_DIR = Path.home() / ".gngram-lookup" / "data"
 
+CHUNK_SIZE = 1024 * 1024  # 1MB reads from the HTTP response
+
+
+class _ProgressReader:
+    """Read-only file wrapper that prints download progress as it is consumed."""
+
+    def __init__(self, fileobj, total_size: int | None) -> None:
+        self._fileobj = fileobj
+        self._total_size = total_size
+        self._downloaded = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._fileobj.read(size)
+        self._downloaded += len(chunk)
+        mb = self._downloaded / 1024 / 1024
+        if self._total_size:
+            pct = self._downloaded / self._total_size * 100
+            print(f"\r  {mb:.1f} MB ({pct:.0f}%)", end="", flush=True)
+        else:
+            print(f"\r  {mb:.1f} MB", end="", flush=True)
+        return chunk
+
 
 def get_download_url() -> str:
     return f"https://github.com/{GITHUB_REPO}/releases/download/{DATA_VERSION}/{DATA_FILENAME}"
@@ -31,6 +57,22 @@ def download_and_extract() -> None:
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Extract into a scratch directory and move the files in only once the
+    # whole archive has arrived, so a failed download never leaves a partial
+    # install behind
+    staging = Path(tempfile.mkdtemp(prefix=".data-", dir=DATA_DIR.parent))
+    try:
+        _download_into(url, staging)
+        _install_staged(staging, DATA_DIR)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    parquet_files = list(DATA_DIR.glob("**/*.parquet"))
+    print(f"Done: {len(parquet_files)} parquet files installed to {DATA_DIR}")
+
+
+def _download_into(url: str, staging: Path) -> None:
+    """Stream the release tarball from `url` and extract it into `staging`."""
     try:
         with urllib.request.urlopen(url) as response:
             total_size = response.headers.get("Content-Length")
@@ -38,28 +80,12 @@ def download_and_extract() -> None:
                 total_size = int(total_size)
                 print(f"Size: {total_size / 1024 / 1024:.1f} MB")
 
-            data = BytesIO()
-            downloaded = 0
-            chunk_size = 1024 * 1024  # 1MB chunks
-
-            while True:
-                chunk = response.read(chunk_size)
-                if not chunk:
-                    break
-                data.write(chunk)
-                downloaded += len(chunk)
-                if total_size:
-                    pct = downloaded / total_size * 100
-                    print(f"\r  {downloaded / 1024 / 1024:.1f} MB ({pct:.0f}%)", end="", flush=True)
-                else:
-                    print(f"\r  {downloaded / 1024 / 1024:.1f} MB", end="", flush=True)
-
+            # Stream the gzip tarball straight from the response so that
+            # decompression overlaps the download and nothing is buffered
+            reader = _ProgressReader(response, total_size)
+            with tarfile.open(fileobj=reader, mode="r|gz", bufsize=CHUNK_SIZE) as tar:
+                tar.extractall(staging, filter="data")
             print()
-            data.seek(0)
-
-            print("Extracting...")
-            with tarfile.open(fileobj=data, mode="r:gz") as tar:
-                tar.extractall(DATA_DIR, filter="data")
 
     except urllib.error.HTTPError as e:
         print(f"Error: Failed to download ({e.code} {e.reason})")
@@ -69,9 +95,22 @@ def download_and_extract() -> None:
     except urllib.error.URLError as e:
         print(f"Error: Network error ({e.reason})")
         sys.exit(1)
+    except (http.client.HTTPException, tarfile.TarError, EOFError, OSError) as e:
+        print()
+        print(f"Error: Download interrupted or archive incomplete ({e!r})")
+        print("Nothing was installed; run the download again.")
+        sys.exit(1)
 
-    parquet_files = list(DATA_DIR.glob("**/*.parquet"))
-    print(f"Done: {len(parquet_files)} parquet files installed to {DATA_DIR}")
+
+def _install_staged(staging: Path, target: Path) -> None:
+    """Move extracted entries from `staging` into `target`, replacing old copies."""
+    for entry in staging.iterdir():
+        dest = target / entry.name
+        if dest.is_dir():
+            shutil.rmtree(dest)
+        elif dest.exists():
+            dest.unlink()
+        entry.rename(dest)
 
 
 def ensure_data() -> None:
@@ -28,10 +28,12 @@ def _load() -> dict[str, list[str]]:
             _SUFFIXES = {}
         else:
             import polars as pl
-            _SUFFIXES = {
-                row["word"]: row["suffixes"].split("|")
-                for row in pl.read_parquet(_DATA_FILE).to_dicts()
-            }
+            # Split in Polars rather than materializing one dict per row
+            df = pl.read_parquet(_DATA_FILE, columns=["word", "suffixes"])
+            _SUFFIXES = dict(zip(
+                df["word"].to_list(),
+                df["suffixes"].str.split("|").to_list(),
+            ))
     return _SUFFIXES
 
 
@@ -14,7 +14,11 @@ from __future__ import annotations
 import bisect
 import hashlib
 import math
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from operator import itemgetter
 from typing import Literal, TypedDict
 
 import polars as pl
@@ -36,37 +40,97 @@ class FrequencyData(TypedDict):
 # Order matters: longer suffixes must be checked before shorter ones
 CONTRACTION_SUFFIXES = ("n't", "'ll", "'re", "'ve", "'m", "'d")
 
+# Single anchored match over CONTRACTION_SUFFIXES plus 's; the lazy stem
+# means the longest matching suffix wins, as with the ordered tuple above
+_CONTRACTION_RE = re.compile(
+    r"(.+?)(" + "|".join(re.escape(s) for s in (*CONTRACTION_SUFFIXES, "'s")) + r")",
+    re.DOTALL,
+)
 
-@lru_cache(maxsize=256)
-def _load_bucket(prefix: str) -> pl.DataFrame:
-    """Load and cache a parquet bucket file."""
-    return pl.read_parquet(get_hash_file(prefix))
+# normalize() output is ASCII, so this is the whole letter alphabet
+_LETTER_RE = re.compile(r"[a-z]")
+
+_BUCKET_COLUMNS = ["hash", "peak_tf", "peak_df", "sum_tf", "sum_df"]
+
+# One slot per hash bucket, addressed by the first digest byte
+_BUCKETS: list[pl.DataFrame | None] = [None] * 256
+
+
+def _load_bucket(bucket_id: int) -> pl.DataFrame:
+    """Load and cache a parquet bucket file, sorted by hash suffix."""
+    bucket = _BUCKETS[bucket_id]
+    if bucket is None:
+        bucket = (
+            pl.read_parquet(get_hash_file(f"{bucket_id:02x}"), columns=_BUCKET_COLUMNS)
+            .with_columns(pl.col("peak_tf", "peak_df").cast(pl.UInt16))
+            .sort("hash")
+        )
+        _BUCKETS[bucket_id] = bucket
+    return bucket
+
+
+def _load_buckets(bucket_ids: Iterable[int]) -> None:
+    """Load every uncached bucket among `bucket_ids` on a thread pool."""
+    missing = [bucket_id for bucket_id in bucket_ids if _BUCKETS[bucket_id] is None]
+    if len(missing) == 1:
+        _load_bucket(missing[0])
+    elif missing:
+        with ThreadPoolExecutor() as executor:
+            # list() drains the results so loader errors propagate here
+            list(executor.map(_load_bucket, missing))
+
+
+def _bucket_index(bucket: pl.DataFrame, suffix: str) -> int | None:
+    """Binary-search a loaded bucket for a hash suffix and return its row."""
+    hashes = bucket["hash"]
+    idx = bisect.bisect_left(hashes, suffix)
+    if idx < len(hashes) and hashes[idx] == suffix:
+        return idx
+    return None
+
+
+def _bucket_row(bucket: pl.DataFrame, idx: int) -> FrequencyData:
+    """Build FrequencyData for row `idx` of a loaded bucket."""
+    _, peak_tf, peak_df, sum_tf, sum_df = bucket.row(idx)
+    return FrequencyData(
+        peak_tf=peak_tf,
+        peak_df=peak_df,
+        sum_tf=sum_tf,
+        sum_df=sum_df,
+    )
+
+
+def _hash_normalized(word: str) -> tuple[str, str]:
+    """Hash an already-normalized word and return (prefix, suffix)."""
+    h = hashlib.md5(word.encode("utf-8")).hexdigest()
+    return h[:2], h[2:]
 
 
 def _hash_word(word: str) -> tuple[str, str]:
     """Hash a word and return (prefix, suffix)."""
-    h = hashlib.md5(normalize(word).encode("utf-8")).hexdigest()
-    return h[:2], h[2:]
+    return _hash_normalized(normalize(word))
+
+
+@lru_cache(maxsize=100_000)
+def _digest_normalized(word: str) -> tuple[int, str]:
+    """Hash an already-normalized word and return (bucket id, suffix)."""
+    prefix, suffix = _hash_normalized(word)
+    return int(prefix, 16), suffix
 
 
 def _lookup_frequency(word: str) -> FrequencyData | None:
-    """Look up frequency data for a single word form (no fallbacks)."""
+    """Look up frequency data for a single normalized word form (no fallbacks)."""
     if not word:
         return None
-    prefix, suffix = _hash_word(word)
+    bucket_id, suffix = _digest_normalized(word)
     try:
-        df = _load_bucket(prefix)
+        bucket = _load_bucket(bucket_id)
     except FileNotFoundError:
         return None
-    row = df.filter(pl.col("hash") == suffix)
-    if len(row) == 0:
+    idx = _bucket_index(bucket, suffix)
+    if idx is None:
         return None
-    return FrequencyData(
-        peak_tf=row["peak_tf"][0],
-        peak_df=row["peak_df"][0],
-        sum_tf=row["sum_tf"][0],
-        sum_df=row["sum_df"][0],
-    )
+    return _bucket_row(bucket, idx)
 
 
 def _split_contraction(word: str) -> tuple[str, str] | None:
@@ -79,19 +143,20 @@ def _split_contraction(word: str) -> tuple[str, str] | None:
     Returns:
         Tuple of (stem, suffix) or None if no pattern matches.
     """
-    for suffix in CONTRACTION_SUFFIXES:
-        if word.endswith(suffix):
-            stem = word[:-len(suffix)]
-            if stem:
-                return (stem, suffix)
-
-    # Any 's — covers both contractions ("it's") and possessives ("ship's")
-    if word.endswith("'s"):
-        stem = word[:-2]
-        if stem:
-            return (stem, "'s")
+    # Most lookups carry no apostrophe at all; skip the regex for them
+    if "'" not in word:
+        return None
 
-    return None
+    # Any 's covers both contractions ("it's") and possessives ("ship's")
+    m = _CONTRACTION_RE.fullmatch(word)
+    if m is None:
+        return None
+    # Tokenized text separates the suffix ("do n't", "ship 's"); the stem is
+    # hashed as-is, so drop the space the normalized word carried before it
+    stem = m.group(1).rstrip()
+    if not stem:
+        return None
+    return (stem, m.group(2))
 
 
 def _split_hyphenated(word: str) -> list[str] | None:
@@ -103,12 +168,17 @@ def _split_hyphenated(word: str) -> list[str] | None:
     """
     if "-" not in word:
         return None
-    parts = [p for p in word.split("-") if p]
+    parts = [p.strip() for p in word.split("-") if p]
     if len(parts) < 2:
         return None
     return parts
 
 
+def _is_lookup_candidate(word: str) -> bool:
+    """Check whether a normalized word contains a letter and so could match."""
+    return word.isalpha() or _LETTER_RE.search(word) is not None
+
+
 def exists(word: str) -> bool:
     """Check if a word exists in the ngram data.
 
@@ -132,6 +202,8 @@ def exists(word: str) -> bool:
         )
 
     word = normalize(word)
+    if not _is_lookup_candidate(word):
+        return False
 
     if _lookup_frequency(word) is not None:
         return True
@@ -175,6 +247,8 @@ def frequency(word: str) -> FrequencyData | None:
         )
 
     word = normalize(word)
+    if not _is_lookup_candidate(word):
+        return None
 
     result = _lookup_frequency(word)
     if result is not None:
@@ -233,60 +307,75 @@ def batch_frequency(words: list[str]) -> dict[str, FrequencyData | None]:
             "Data files not installed. Run: python -m gngram_lookup.download_data"
         )
 
-    # Group words by bucket prefix for efficient batch lookups
-    by_prefix: dict[str, list[tuple[str, str, str]]] = {}
+    # Collapse inputs that normalize to the same form ("the", "The", "THE"),
+    # so each distinct form is hashed, probed and run through fallbacks once
+    normalized_words = {word: normalize(word) for word in words}
+
+    # Group distinct forms by bucket for efficient batch lookups
+    found: dict[str, FrequencyData | None] = {}
+    by_bucket: dict[int, list[tuple[str, str]]] = {}
+    for normalized in dict.fromkeys(normalized_words.values()):
+        if not _is_lookup_candidate(normalized):
+            found[normalized] = None
+            continue
+        bucket_id, suffix = _digest_normalized(normalized)
+        if bucket_id not in by_bucket:
+            by_bucket[bucket_id] = []
+        by_bucket[bucket_id].append((normalized, suffix))
+
+    _load_buckets(by_bucket)
+
     fallback_words: list[str] = []
 
-    for word in words:
-        normalized = normalize(word)
-        prefix, suffix = _hash_word(normalized)
-        if prefix not in by_prefix:
-            by_prefix[prefix] = []
-        by_prefix[prefix].append((word, normalized, suffix))
-
-    results: dict[str, FrequencyData | None] = {}
-
-    for prefix, entries in by_prefix.items():
-        df = _load_bucket(prefix)
-        suffixes = [s for _, _, s in entries]
-
-        # Filter to all matching suffixes at once
-        matches = df.filter(pl.col("hash").is_in(suffixes))
-        match_dict = {row["hash"]: row for row in matches.iter_rows(named=True)}
-
-        for word, normalized, suffix in entries:
-            if suffix in match_dict:
-                row = match_dict[suffix]
-                results[word] = FrequencyData(
-                    peak_tf=row["peak_tf"],
-                    peak_df=row["peak_df"],
-                    sum_tf=row["sum_tf"],
-                    sum_df=row["sum_df"],
-                )
+    for bucket_id, entries in by_bucket.items():
+        bucket = _load_bucket(bucket_id)
+        hashes = bucket["hash"]
+
+        # One vectorized binary search covers every suffix in this bucket
+        positions = hashes.search_sorted(pl.Series([suffix for _, suffix in entries]))
+        for (normalized, suffix), idx in zip(entries, positions):
+            if idx < len(hashes) and hashes[idx] == suffix:
+                found[normalized] = _bucket_row(bucket, idx)
             else:
-                results[word] = None
-                fallback_words.append(word)
+                found[normalized] = None
+                fallback_words.append(normalized)
 
     # Fallback for words not found directly
-    for word in fallback_words:
-        normalized = normalize(word)
-
+    for normalized in fallback_words:
         # Contraction/possessive fallback
         parts = _split_contraction(normalized)
         if parts:
             stem, _ = parts
             stem_freq = _lookup_frequency(stem)
             if stem_freq is not None:
-                results[word] = stem_freq
+                found[normalized] = stem_freq
                 continue
 
         # Hyphenated fallback
         hyp_parts = _split_hyphenated(normalized)
         if hyp_parts:
             if all(_lookup_frequency(p) is not None for p in hyp_parts):
-                results[word] = _lookup_frequency(hyp_parts[0])
+                found[normalized] = _lookup_frequency(hyp_parts[0])
+
+    # Fan results back out to the caller's original keys
+    return {word: found[normalized] for word, normalized in normalized_words.items()}
 
-    return results
+
+def preload() -> None:
+    """Load every frequency bucket into memory up front.
+
+    Buckets are otherwise loaded lazily, on the first lookup that hashes into
+    them. Long-running processes and large batch jobs can call this once at
+    startup so that every later lookup is an in-memory probe with no file I/O.
+
+    Raises:
+        FileNotFoundError: If data files are not installed
+    """
+    if not is_data_installed():
+        raise FileNotFoundError(
+            "Data files not installed. Run: python -m gngram_lookup.download_data"
+        )
+    _load_buckets(range(len(_BUCKETS)))
 
 
 @lru_cache(maxsize=1)
@@ -387,9 +476,10 @@ def prefix_cluster(
                 seen.add(pair[0])
 
     if sort_by == "freq":
-        candidates.sort(key=lambda x: x[1], reverse=True)
+        candidates.sort(key=itemgetter(1), reverse=True)
     else:
-        candidates.sort(key=lambda x: x[0])
+        # Words are unique, so plain tuple order is alphabetical order
+        candidates.sort()
 
     if with_freq:
         return candidates
@@ -453,9 +543,10 @@ def erosion_cluster(
                 candidates.append((w, tfs[i]))
 
     if sort_by == "freq":
-        candidates.sort(key=lambda x: x[1], reverse=True)
+        candidates.sort(key=itemgetter(1), reverse=True)
     else:
-        candidates.sort(key=lambda x: x[0])
+        # Words are unique, so plain tuple order is alphabetical order
+        candidates.sort()
 
     if with_freq:
         return candidates
@@ -8,6 +8,7 @@ ngram corpus (which is ASCII-only).
 from __future__ import annotations
 
 import unicodedata
+from functools import lru_cache
 
 # Unicode characters that should normalize to ASCII apostrophe (U+0027)
 # Ordered by likelihood of occurrence in English text
@@ -34,13 +35,24 @@ APOSTROPHE_VARIANTS = (
     '\uA78C'  # LATIN SMALL LETTER SALTILLO
 )
 
-# Pre-compiled translation table for fast apostrophe normalization
-_APOSTROPHE_TABLE = str.maketrans({char: "'" for char in APOSTROPHE_VARIANTS})
+_APOSTROPHE_CODEPOINTS = frozenset(map(ord, APOSTROPHE_VARIANTS))
+
+
+@lru_cache(maxsize=1)
+def _dense_apostrophe_table() -> str:
+    """Build a code-point-indexed str.translate table mapping each variant to "'"."""
+    table = list(map(chr, range(max(_APOSTROPHE_CODEPOINTS) + 1)))
+    for cp in _APOSTROPHE_CODEPOINTS:
+        table[cp] = "'"
+    return "".join(table)
 
 
 def normalize_apostrophes(text: str) -> str:
     """Normalize Unicode apostrophe variants to ASCII apostrophe."""
-    return text.translate(_APOSTROPHE_TABLE)
+    if text.isascii():
+        # The grave accent is the only ASCII variant
+        return text.replace("`", "'")
+    return text.translate(_dense_apostrophe_table())
 
 
 def strip_accents(text: str) -> str:
@@ -52,11 +64,20 @@ def strip_accents(text: str) -> str:
     return unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
 
 
+@lru_cache(maxsize=65536)
 def normalize(text: str) -> str:
     """Normalize text for ngram lookup.
 
     Applies: apostrophe normalization, accent stripping, lowercase, strip whitespace.
+    Results are memoized, since lookup traffic repeats a small hot vocabulary.
     """
-    text = normalize_apostrophes(text)
+    if text.isascii():
+        # Accent stripping is a no-op on ASCII, so only the grave-accent
+        # apostrophe needs handling; strip first to shorten later passes
+        return text.strip().replace("`", "'").lower()
+    # Strip up front so the translate and NFKD passes touch less of a padded
+    # input, and again at the end: dropping combining marks can expose new
+    # edge whitespace ("hello \u0301" -> "hello ")
+    text = normalize_apostrophes(text.strip())
     text = strip_accents(text)
     return text.lower().strip()
@@ -60,3 +60,11 @@ class TestBatchFrequency:
         assert "peak_df" in data
         assert "sum_tf" in data
         assert "sum_df" in data
+
+    def test_batch_frequency_case_variants_share_result(self):
+        result = batch_frequency(["the", "THE", "The", " the "])
+        assert len(result) == 4
+        assert result["the"] is not None
+        assert result["THE"] == result["the"]
+        assert result["The"] == result["the"]
+        assert result[" the "] == result["the"]
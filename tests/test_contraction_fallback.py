@@ -158,3 +158,14 @@ class TestContractionFallback:
             assert batch_result[word] == frequency(word), (
                 f"batch != individual for {word!r}"
             )
+
+    def test_exists_tokenized_contraction(self):
+        assert exists("it 's") is True
+
+    def test_frequency_tokenized_possessive_equals_stem(self):
+        assert frequency("ship 's") == frequency("ship")
+
+    def test_batch_frequency_tokenized_contraction(self):
+        result = batch_frequency(["do n't"])
+        assert result["do n't"] is not None
+        assert result["do n't"] == frequency("do")
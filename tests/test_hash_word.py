@@ -1,4 +1,4 @@
-from gngram_lookup.lookup import _hash_word
+from gngram_lookup.lookup import _digest_normalized, _hash_normalized, _hash_word
 
 
 class TestHashWord:
@@ -30,3 +30,30 @@ class TestHashWord:
 
     def test_hash_word_whitespace_stripped(self):
         assert _hash_word("  hello  ") == _hash_word("hello")
+
+
+class TestHashNormalized:
+    def test_hash_normalized_matches_hash_word(self):
+        assert _hash_normalized("hello") == _hash_word("  HELLO  ")
+
+    def test_hash_normalized_skips_normalization(self):
+        assert _hash_normalized("HELLO") != _hash_word("HELLO")
+
+
+class TestDigestNormalized:
+    def test_digest_normalized_matches_hex(self):
+        prefix, suffix = _hash_normalized("hello")
+        bucket_id, digest_suffix = _digest_normalized("hello")
+        assert bucket_id == int(prefix, 16)
+        assert digest_suffix == suffix
+
+    def test_digest_normalized_bucket_id_range(self):
+        for word in ("the", "example", "zebra"):
+            bucket_id, _ = _digest_normalized(word)
+            assert 0 <= bucket_id < 256
+
+    def test_digest_normalized_is_cached(self):
+        _digest_normalized("cached")
+        hits = _digest_normalized.cache_info().hits
+        assert _digest_normalized("cached") == _digest_normalized("cached")
+        assert _digest_normalized.cache_info().hits >= hits + 2
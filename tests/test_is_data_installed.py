@@ -8,3 +8,9 @@ class TestIsFrequencyDataInstalled:
 
     def test_is_data_installed_is_true(self):
         assert is_data_installed() is True
+
+    def test_is_data_installed_caches_positive_result(self):
+        from gngram_lookup import data
+
+        assert is_data_installed() is True
+        assert data._DATA_INSTALLED is True
@@ -0,0 +1,27 @@
+from gngram_lookup.lookup import _is_lookup_candidate
+
+
+class TestIsLookupCandidate:
+    def test_plain_word(self):
+        assert _is_lookup_candidate("hello") is True
+
+    def test_contraction(self):
+        assert _is_lookup_candidate("don't") is True
+
+    def test_hyphenated(self):
+        assert _is_lookup_candidate("quarter-deck") is True
+
+    def test_mixed_digits_and_letters(self):
+        assert _is_lookup_candidate("abc123") is True
+
+    def test_empty(self):
+        assert _is_lookup_candidate("") is False
+
+    def test_digits_only(self):
+        assert _is_lookup_candidate("12345") is False
+
+    def test_punctuation_only(self):
+        assert _is_lookup_candidate("!@#$%") is False
+
+    def test_hyphens_and_apostrophes_only(self):
+        assert _is_lookup_candidate("-'-") is False
@@ -88,3 +88,12 @@ class TestNormalize:
 
     def test_normalize_accent_with_apostrophe(self):
         assert normalize("café\u2019s") == "cafe's"
+
+    def test_normalize_apostrophes_ascii_grave_accent(self):
+        assert normalize_apostrophes("DON\u0060T") == "DON'T"
+
+    def test_normalize_ascii_grave_upper_whitespace(self):
+        assert normalize("  DON\u0060T  ") == "don't"
+
+    def test_normalize_strips_whitespace_exposed_by_accent_removal(self):
+        assert normalize("  hello \u0301") == "hello"
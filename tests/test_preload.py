@@ -0,0 +1,22 @@
+from gngram_lookup import batch_frequency, frequency, preload
+from gngram_lookup.lookup import _BUCKETS
+
+
+class TestPreload:
+    def test_preload_returns_none(self):
+        assert preload() is None
+
+    def test_preload_is_idempotent(self):
+        preload()
+        preload()
+        assert frequency("the") is not None
+
+    def test_lookups_unchanged_after_preload(self):
+        before = batch_frequency(["the", "and", "xyznotarealword123"])
+        preload()
+        after = batch_frequency(["the", "and", "xyznotarealword123"])
+        assert before == after
+
+    def test_preload_fills_every_bucket(self):
+        preload()
+        assert all(bucket is not None for bucket in _BUCKETS)
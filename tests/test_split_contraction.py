@@ -5,6 +5,13 @@ class TestSplitContraction:
     def test_split_nt(self):
         assert _split_contraction("don't") == ("do", "n't")
 
+    def test_split_strips_space_before_suffix(self):
+        assert _split_contraction("do n't") == ("do", "n't")
+        assert _split_contraction("ship 's") == ("ship", "'s")
+
+    def test_split_whitespace_stem(self):
+        assert _split_contraction(" 's") is None
+
     def test_split_ll(self):
         assert _split_contraction("we'll") == ("we", "'ll")
 
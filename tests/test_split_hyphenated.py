@@ -25,3 +25,9 @@ class TestSplitHyphenated:
 
     def test_split_double_hyphen(self):
         assert _split_hyphenated("foo--bar") == ["foo", "bar"]
+
+    def test_split_strips_whitespace(self):
+        assert _split_hyphenated("north - west") == ["north", "west"]
+
+    def test_split_keeps_whitespace_only_parts(self):
+        assert _split_hyphenated("foo - - bar") == ["foo", "", "bar"]